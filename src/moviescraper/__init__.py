@@ -0,0 +1,10 @@
+from .browser import discover_endpoints, get_json_requests
+from .scraper import TheaterConfig, TheaterScraper, schedule_batch
+
+__all__ = [
+    "TheaterConfig",
+    "TheaterScraper",
+    "discover_endpoints",
+    "get_json_requests",
+    "schedule_batch",
+]
@@ -1,43 +1,299 @@
 #!/usr/bin/env python3
 
+import atexit
+import queue
+import re
+import threading
+from functools import lru_cache
+from urllib import parse as url_parse
+
+import orjson
+import requests
+from requests import adapters as req_adapters
+from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.wait import WebDriverWait
-from seleniumwire import webdriver
+from urllib3.util import retry as url_retry
 
 
-def get_json_requests(url: str) -> list[str]:
-    """Retrieve all network requests ending in .json from a given URL"""
+def _create_session() -> requests.Session:
+    """Create the pooled HTTP session used for endpoint discovery.
 
-    print(f"Compiling list of JSON requests at: {url}")
+    Discovery hits the same host the scraper's probe fan-out connects
+    to moments later, so its GET should reuse a keep-alive pool with
+    the same retry policy as the rest of the pipeline instead of
+    opening a one-off connection.
 
-    driver = None
+    Returns:
+        A requests.Session configured for discovery calls
+    """
+
+    session = requests.Session()
+    adapter = req_adapters.HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=20,
+        max_retries=url_retry.Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+_SESSION = _create_session()
+atexit.register(_SESSION.close)
+
+
+# URL patterns where Boxoffice CMS sites are known to keep page data.
+# Gatsby pages also request analytics, manifest, and chunk-map .json
+# files that can never contain movie data; filtering those out here
+# saves a full HTTP round trip per URL downstream. Add new patterns
+# when a site layout changes.
+KNOWN_PATTERNS = (
+    re.compile(r"/page-data/.*/page-data\.json$"),
+    re.compile(r"/page-data/sq/d/[0-9a-f]+\.json$"),
+)
+
+
+class _DriverPool:
+    """A pool of persistent Chromium drivers shared across calls.
+
+    Forking a fresh Chromium process costs seconds per launch, so
+    drivers are kept alive and handed back out instead of being quit
+    after every call. Drivers launch lazily on first acquire and are
+    recycled after a fixed number of uses to bound memory growth in
+    the browser process.
+    """
+
+    recycle_after = 100
+
+    # Upper bound on waiting for another thread to return a driver
+    acquire_timeout = 60
+
+    def __init__(self, max_drivers: int = 2):
+        self._max_drivers = max_drivers
+        self._idle: queue.Queue = queue.Queue()
+        self._launched = 0
+        self._lock = threading.Lock()
+
+    # The scraper only needs captured XHRs, not a rendered page, so
+    # GPU, images, extensions, and background services are disabled to
+    # cut Chromium launch time and memory use
+    launch_flags = (
+        "--headless",
+        "--disable-gpu",
+        "--disable-dev-shm-usage",
+        "--no-sandbox",
+        "--disable-extensions",
+        "--disable-background-networking",
+        "--disable-default-apps",
+        "--disable-sync",
+        "--disable-translate",
+        "--metrics-recording-only",
+        "--mute-audio",
+        "--no-first-run",
+        "--safebrowsing-disable-auto-update",
+        "--blink-settings=imagesEnabled=false",
+        "--disable-features=TranslateUI,BlinkGenPropertyTrees",
+    )
+
+    def _launch(self) -> webdriver.Chrome:
+        """Launch a fresh headless Chromium driver"""
 
-    try:
         options = Options()
-        options.add_argument("--headless")
+
+        for flag in self.launch_flags:
+            options.add_argument(flag)
+
         options.binary_location = "/usr/bin/chromium"
+
+        # Capture DevTools network events so request URLs can be read
+        # straight from the performance log
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
         service = Service("/usr/bin/chromedriver")
 
         driver = webdriver.Chrome(service=service, options=options)
+        driver.use_count = 0
+
+        return driver
+
+    def acquire(self) -> webdriver.Chrome:
+        """Check out an idle driver, launching one if none are ready"""
+
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            reserved = self._launched < self._max_drivers
+
+            if reserved:
+                self._launched += 1
+
+        if reserved:
+            try:
+                return self._launch()
+            except Exception:
+                # Give the reserved slot back so a failed launch can
+                # be retried instead of leaking pool capacity
+                with self._lock:
+                    self._launched -= 1
+                raise
+
+        try:
+            return self._idle.get(timeout=self.acquire_timeout)
+        except queue.Empty:
+            raise TimeoutError(
+                f"Timed out after {self.acquire_timeout}s waiting for an idle driver"
+            )
+
+    def release(self, driver: webdriver.Chrome) -> None:
+        """Return a driver to the pool, recycling it when worn out"""
+
+        driver.use_count += 1
+
+        if driver.use_count >= self.recycle_after:
+            self.discard(driver)
+            return
+
+        self._idle.put(driver)
+
+    def discard(self, driver: webdriver.Chrome) -> None:
+        """Quit a driver without returning it to the pool"""
+
+        with self._lock:
+            self._launched -= 1
+
+        driver.quit()
+
+    def shutdown(self) -> None:
+        """Quit every idle driver on interpreter exit"""
+
+        while True:
+            try:
+                self.discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+
+_pool = _DriverPool()
+atexit.register(_pool.shutdown)
+
+
+def discover_endpoints(url: str) -> list[str]:
+    """Discover candidate JSON endpoints without launching a browser.
+
+    Boxoffice CMS websites are built with Gatsby, which serves page data
+    from a predictable path layout: the showtimes page is described by
+    'page-data/<page>/page-data.json' and the static queries it depends
+    on live at 'page-data/sq/d/<hash>.json'. Fetching the page data
+    directly and building the static query URLs from the hashes it lists
+    skips the Chromium launch entirely, which dominates scraper runtime.
+
+    Args:
+        url: The base URL where showtimes are listed on the movie
+            theater website
+
+    Returns:
+        A list of candidate JSON endpoint URLs, or an empty list if the
+            page data could not be fetched
+    """
+
+    print(f"Discovering JSON endpoints at: {url}")
+
+    page_path = url_parse.urlsplit(url).path.strip("/")
+    page_data_url = url_parse.urljoin(url, f"/page-data/{page_path}/page-data.json")
+
+    try:
+        response = _SESSION.get(page_data_url, timeout=30)
+        response.raise_for_status()
+        page_data = orjson.loads(response.content)
+
+    except Exception as e:
+        print(f"Failed to discover JSON endpoints from {url}:", e)
+        return []
+
+    endpoints = [page_data_url]
+
+    for query_hash in page_data.get("staticQueryHashes", []):
+        endpoints.append(url_parse.urljoin(url, f"/page-data/sq/d/{query_hash}.json"))
+
+    return endpoints
+
+
+@lru_cache(maxsize=32)
+def _capture_json_requests(url: str) -> tuple[str, ...]:
+    """Drive a pooled browser to capture page-data JSON requests.
+
+    Only successful captures are worth memoizing, so failures raise
+    out of this function — lru_cache stores nothing on an exception
+    and the next call retries with a fresh driver.
+    """
+
+    driver = None
+
+    try:
+        driver = _pool.acquire()
+
+        # Reading the performance log drains entries left over from
+        # previous uses of this driver
+        driver.get_log("performance")
+
         driver.get(url)
 
         wait = WebDriverWait(driver, timeout=20)
         wait.until(lambda d: d.find_element(By.TAG_NAME, "iframe"))
 
-        endpoints: list[str] = []
-
-        for request in driver.requests:
-            if request.url.endswith(".json"):
-                endpoints.append(request.url)
+        events = (
+            orjson.loads(entry["message"])["message"]
+            for entry in driver.get_log("performance")
+        )
+        urls = (
+            event["params"]["response"]["url"]
+            for event in events
+            if event.get("method") == "Network.responseReceived"
+        )
+        endpoints = tuple(
+            url
+            for url in urls
+            if any(pattern.search(url) for pattern in KNOWN_PATTERNS)
+        )
 
+        _pool.release(driver)
         return endpoints
 
+    except Exception:
+        if driver:
+            _pool.discard(driver)
+
+        raise
+
+
+def get_json_requests(url: str) -> tuple[str, ...]:
+    """Retrieve page-data JSON requests observed at a given URL.
+
+    Each capture launches a headless Chromium and waits on the page to
+    load, which costs several seconds, while the endpoint list for a
+    given URL does not change within a process. Successful results are
+    memoized per URL so repeated scraper runs in the same process skip
+    the browser launch entirely; failed captures are reported and never
+    cached, so a transient Chromium error cannot poison later runs.
+    The result is a tuple so the cached value stays immutable.
+    """
+
+    print(f"Compiling list of JSON requests at: {url}")
+
+    try:
+        return _capture_json_requests(url)
+
     except Exception as e:
         print(f"Failed to retrieve JSON requests from {url}:", e)
-        return []
-
-    finally:
-        if driver:
-            driver.quit()
+        return ()
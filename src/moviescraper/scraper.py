@@ -1,17 +1,88 @@
 #!/usr/bin/env python3
 
+import atexit
+import hashlib
 import os
+import sys
+import time
+from concurrent import futures
 from datetime import datetime
+from functools import cached_property
+from pathlib import Path
 from typing import Sequence
 
 import dotenv
+import orjson
 import requests
-from dateutil import relativedelta as date_delta
+from requests import adapters as req_adapters
 from requests import exceptions as req_exceptions
+from urllib3.util import retry as url_retry
 
 from . import browser
 
 
+def _create_session() -> requests.Session:
+    """Create the HTTP session shared by every scraper in the process.
+
+    All scrapers talk to the same Boxoffice CMS infrastructure, so one
+    keep-alive session lets multiple theater instances reuse the same
+    connection pool instead of each paying its own TCP and TLS
+    handshakes. Transient gateway errors are retried with a short
+    backoff.
+
+    Returns:
+        A requests.Session configured for the scraper's calls
+    """
+
+    session = requests.Session()
+    adapter = req_adapters.HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=20,
+        max_retries=url_retry.Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+_SESSION = _create_session()
+
+
+def close_session() -> None:
+    """Close the shared HTTP session and its connection pool"""
+
+    _SESSION.close()
+
+
+atexit.register(close_session)
+
+
+def _schedule_window() -> tuple[str, str]:
+    """Get the ISO timestamp pair spanning today through next year.
+
+    A direct year replacement is the cheapest way to land on the same
+    date next year; Feb 29 falls back to Feb 28 on the rare leap-day
+    run.
+
+    Returns:
+        (from_iso, to_iso): ISO timestamps for today and one year out
+    """
+
+    today = datetime.today()
+
+    try:
+        next_year = today.replace(year=today.year + 1)
+    except ValueError:
+        next_year = today.replace(year=today.year + 1, day=28)
+
+    return today.isoformat(), next_year.isoformat()
+
+
 class TheaterConfig:
     """The configuration class required by the TheaterScraper class.
 
@@ -35,6 +106,8 @@ class TheaterConfig:
         example_scraper = TheaterScraper(example_config)
     """
 
+    __slots__ = ("showtimes_url", "website_id", "theater_id", "schedule_endpoint")
+
     def __init__(
         self,
         showtimes_url: str,
@@ -76,25 +149,24 @@ class TheaterConfig:
 
         dotenv.load_dotenv(env_file)
 
-        required_vars = [
+        required_vars = (
             "SHOWTIMES_URL",
             "WEBSITE_ID",
             "THEATER_ID",
             "SCHEDULE_ENDPOINT",
-        ]
-        missing_vars = [var for var in required_vars if not os.getenv(var)]
+        )
+
+        # Read each variable once; the same values feed both the
+        # missing check and the constructor
+        env_values = {var: os.environ.get(var) for var in required_vars}
+        missing_vars = [var for var, value in env_values.items() if not value]
 
         if missing_vars:
             raise ValueError(
                 f"Missing required environment variables from {env_file}: {', '.join(missing_vars)}"
             )
 
-        return cls(
-            showtimes_url=os.environ["SHOWTIMES_URL"],
-            website_id=os.environ["WEBSITE_ID"],
-            theater_id=os.environ["THEATER_ID"],
-            schedule_endpoint=os.environ["SCHEDULE_ENDPOINT"],
-        )
+        return cls(*(env_values[var] for var in required_vars))
 
 
 class TheaterScraper:
@@ -120,19 +192,53 @@ class TheaterScraper:
         example_scraper = TheaterScraper(example_config)
     """
 
+    # Cinema schedules change at most a few times a day, so a cached
+    # schedule this fresh is served without re-POSTing
+    schedule_cache_ttl = 900
+
     def __init__(self, config: TheaterConfig):
         self.theater_config = config
-        self.movie_data = self._fetch_movie_data()
-        self.movie_nodes = self._get_movie_nodes()
-        self.movie_ids = self._get_movie_ids()
+        self._session = _SESSION
+        self._schedule_future = None
+
+    @cached_property
+    def movie_data(self) -> tuple[str, dict]:
+        """Endpoint and movie data pair, fetched on first access.
+
+        Construction stays free of network I/O; the endpoint probe
+        runs once, on the first read of this property.
+        """
+
+        return self._fetch_movie_data()
+
+    @cached_property
+    def movie_nodes(self) -> Sequence[dict]:
+        """Nodes for each movie currently listed on the website"""
+
+        _, data = self.movie_data
+        return data["nodes"]
+
+    @cached_property
+    def _nodes_by_id(self) -> dict[str, dict]:
+        """Index of movie nodes keyed by Boxoffice CMS movie ID"""
+
+        return {node["id"]: node for node in self.movie_nodes}
+
+    @cached_property
+    def movie_ids(self) -> tuple[str, ...]:
+        """IDs of all movies currently listed on the theater website"""
+
+        return tuple(self._nodes_by_id)
 
     def _fetch_movie_data(self) -> tuple[str, dict]:
         """Find movie data from list of JSON requests.
 
-        Searches list of JSON requests for 'allMovie' key in response
-        data for each endpoint. If the key is found and key value is
-        not None, returns a tuple containing the endpoint and the
-        response data.
+        Probes each candidate endpoint for the 'allMovie' key in its
+        response data. Only one endpoint contains the key, so all
+        probes are issued concurrently and the first hit wins rather
+        than waiting a full round trip per endpoint. If the key is
+        found and key value is not None, returns a tuple containing
+        the endpoint and the response data.
 
         Returns:
             (endpoint, movie_data): Tuple containing API endpoint containing
@@ -142,45 +248,229 @@ class TheaterScraper:
 
         showtimes_url = self.theater_config.showtimes_url
 
-        for endpoint in browser.get_json_requests(showtimes_url):
+        # One endpoint pattern consistently carries allMovie, so the
+        # winner from the previous run is tried alone before paying
+        # for discovery and the full probe fan-out
+        last_endpoint = self._recall_endpoint()
+
+        if last_endpoint:
             try:
-                response = requests.get(endpoint, timeout=30)
-                response.raise_for_status()
-                data = response.json().get("data", {})
+                movie_data = self._probe_endpoint(last_endpoint)
+            except req_exceptions.RequestException:
+                movie_data = None
+
+            if movie_data is not None:
+                print(f"Successfully found movie data at: {last_endpoint}")
+                return (last_endpoint, movie_data)
+
+        endpoints = browser.discover_endpoints(showtimes_url)
+
+        if not endpoints:
+            endpoints = browser.get_json_requests(showtimes_url)
 
-                if "allMovie" in data and data.get("allMovie") is not None:
+        with futures.ThreadPoolExecutor(max_workers=8) as executor:
+            probes = {
+                executor.submit(self._probe_endpoint, endpoint): endpoint
+                for endpoint in endpoints
+                if endpoint != last_endpoint
+            }
+
+            for probe in futures.as_completed(probes):
+                try:
+                    movie_data = probe.result()
+
+                # A failing candidate must not abort the fan-out while
+                # the winning endpoint may still be in flight
+                except req_exceptions.RequestException as e:
+                    print(f"Endpoint probe failed: {e}")
+                    continue
+
+                if movie_data is not None:
+                    for pending in probes:
+                        pending.cancel()
+
+                    endpoint = probes[probe]
                     print(f"Successfully found movie data at: {endpoint}")
 
-                    movie_data = data["allMovie"]
+                    self._remember_endpoint(endpoint)
                     return (endpoint, movie_data)
 
-            except req_exceptions.RequestException as e:
-                raise req_exceptions.RequestException(
-                    f"Failed to get movie data from {endpoint}: {e}"
-                )
-
         raise ValueError("Could not find API endpoint containing the 'allMovie' key")
 
-    def _get_movie_nodes(self) -> Sequence[dict]:
-        """Get list of movies nodes.
+    def _last_endpoint_path(self) -> Path:
+        """Get the on-disk location of the remembered winning endpoint"""
+
+        return (
+            Path.home()
+            / ".cache"
+            / "moviescraper"
+            / f"{self.theater_config.website_id}.last_endpoint"
+        )
+
+    def _recall_endpoint(self) -> str | None:
+        """Read the endpoint that carried movie data on the last run"""
+
+        path = self._last_endpoint_path()
+
+        if not path.exists():
+            return None
+
+        return path.read_text().strip() or None
+
+    def _remember_endpoint(self, endpoint: str) -> None:
+        """Persist the winning endpoint so the next run tries it first"""
+
+        path = self._last_endpoint_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        temp_path = path.with_suffix(".last_endpoint.tmp")
+        temp_path.write_text(endpoint)
+        os.replace(temp_path, path)
+
+    def _probe_endpoint(self, endpoint: str) -> dict | None:
+        """Check a single endpoint for the 'allMovie' key.
+
+        Sessions are thread-safe for plain requests, so probes can
+        share the scraper's pooled session.
 
         Returns:
-            A list containing nodes for each movie currently listed on
-                the theater website
+            The value of the 'allMovie' key, or None if the endpoint
+                does not contain it
         """
 
-        _, data = self.movie_data
-        return data["nodes"]
+        try:
+            if self._cache_path(endpoint).exists():
+                body = self._cached_get(endpoint)
+            else:
+                body = self._stream_probe(endpoint)
+
+        except req_exceptions.RequestException as e:
+            raise req_exceptions.RequestException(
+                f"Failed to get movie data from {endpoint}: {e}"
+            )
+
+        # A byte-level scan is far cheaper than a JSON decode, so only
+        # parse bodies that can actually contain the key
+        if body is None or b'"allMovie"' not in body:
+            return None
+
+        data = orjson.loads(body).get("data", {})
+
+        return data.get("allMovie")
+
+    def _stream_probe(self, url: str) -> bytes | None:
+        """Fetch an uncached endpoint, aborting early on a miss.
+
+        Downloading a multi-megabyte Gatsby payload just to reject it
+        wastes bandwidth, so only the first 64 KB is read before the
+        'allMovie' scan. Misses close the connection there and are not
+        cached, since rejecting them again costs almost nothing; hits
+        drain the rest of the body and seed the disk cache.
+
+        Args:
+            url: The URL of the JSON document to fetch
+
+        Returns:
+            The full response body for a hit, or None for a miss
+        """
+
+        with self._session.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+
+            head = next(response.iter_content(chunk_size=65536), b"")
+
+            if b'"allMovie"' not in head:
+                return None
+
+            body = head + b"".join(response.iter_content(chunk_size=1 << 20))
+            headers = response.headers
+
+        self._store_cache(url, headers, body)
+
+        return body
+
+    def _cache_path(self, url: str) -> Path:
+        """Get the on-disk cache location for a URL's response body"""
+
+        url_hash = hashlib.sha1(url.encode()).hexdigest()
 
-    def _get_movie_ids(self) -> Sequence[str]:
-        """Get list of movie IDs from movie nodes.
+        return (
+            Path.home()
+            / ".cache"
+            / "moviescraper"
+            / self.theater_config.theater_id
+            / f"{url_hash}.json"
+        )
+
+    def _cached_get(self, url: str) -> bytes:
+        """Fetch a JSON document through an ETag-validated disk cache.
+
+        The Boxoffice CMS JSON changes at most a few times a day, so
+        the last response body is kept on disk along with its ETag and
+        Last-Modified headers. The next request revalidates with
+        If-None-Match/If-Modified-Since, and a 304 reply serves the
+        cached body without re-downloading the payload.
+
+        Args:
+            url: The URL of the JSON document to fetch
 
         Returns:
-            A list of IDs for all movies currently listed on the
-                theater website
+            The raw JSON response body, leaving the decode (or skip)
+                decision to the caller
         """
 
-        return [node["id"] for node in self.movie_nodes]
+        cache_path = self._cache_path(url)
+        meta_path = cache_path.with_suffix(".meta.json")
+        headers = {}
+
+        if cache_path.exists() and meta_path.exists():
+            meta = orjson.loads(meta_path.read_bytes())
+
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = self._session.get(url, headers=headers, timeout=30)
+
+        if response.status_code == 304:
+            return cache_path.read_bytes()
+
+        response.raise_for_status()
+
+        self._store_cache(url, response.headers, response.content)
+
+        return response.content
+
+    def _store_cache(self, url: str, headers, body: bytes) -> None:
+        """Atomically write a response body and its validators to disk"""
+
+        cache_path = self._cache_path(url)
+        meta_path = cache_path.with_suffix(".meta.json")
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        meta = {
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+        }
+
+        temp_path = cache_path.with_suffix(".json.tmp")
+        temp_path.write_bytes(body)
+        os.replace(temp_path, cache_path)
+
+        temp_meta_path = meta_path.with_suffix(".json.tmp")
+        temp_meta_path.write_bytes(orjson.dumps(meta))
+        os.replace(temp_meta_path, meta_path)
+
+    def get_movie(self, movie_id: str) -> dict | None:
+        """Get a single movie node by its Boxoffice CMS ID.
+
+        Returns:
+            The node for the given movie ID, or None if the theater
+                does not currently list it
+        """
+
+        return self._nodes_by_id.get(movie_id)
 
     def print_movie_titles(self) -> None:
         """Print movie titles, each separated by a newline"""
@@ -188,27 +478,57 @@ class TheaterScraper:
         if self.movie_nodes is None:
             raise ValueError("Cannot print movie data if movie_nodes is None")
 
-        for movie in self.movie_nodes:
-            print(movie["title"])
+        # One buffered write instead of a lock-and-flush per title
+        titles = "\n".join(movie.get("title", "") for movie in self.movie_nodes)
+        sys.stdout.write(titles + "\n")
 
-    def get_schedule(self) -> Sequence[dict]:
-        """Get current schedule for theater.
+    def prefetch_schedule(self) -> None:
+        """Start fetching the schedule on a background thread.
 
-        Make a POST request to the schedule_endpoint using today's
-        date and the movie IDs found in the current endpoint containing
-        movie data.
+        The schedule POST only depends on the movie IDs, so callers
+        with other work left — parsing nodes, printing titles, or
+        scraping another venue — can overlap it with that work instead
+        of serializing the two network operations. The result lands in
+        movie_schedule, whose first read joins the in-flight request
+        rather than starting a new one.
+        """
 
-        Returns:
-            schedule: A list of unparsed showings, as provided by the
-                Boxoffice CMS API
+        if "movie_schedule" in self.__dict__ or self._schedule_future is not None:
+            return
+
+        executor = futures.ThreadPoolExecutor(max_workers=1)
+        self._schedule_future = executor.submit(self._get_theater_schedule)
+        executor.shutdown(wait=False)
+
+    @cached_property
+    def movie_schedule(self) -> Sequence[dict]:
+        """Current schedule for the theater, fetched on first access.
+
+        Consumers that only need movie titles or IDs never pay for the
+        schedule POST; the request happens once, on the first read of
+        this property, and the result is cached for the lifetime of
+        the scraper. If prefetch_schedule already started the request,
+        this waits on it instead of issuing another.
         """
 
-        config = self.theater_config
+        if self._schedule_future is not None:
+            return self._schedule_future.result()
+
+        return self._get_theater_schedule()
+
+    @cached_property
+    def _schedule_body_template(self) -> dict:
+        """Constant part of the schedule POST body.
+
+        The theaters list, movie IDs, and website ID never change for
+        the lifetime of a scraper, so rebuilding them per call is pure
+        allocation churn for loops that fetch schedules repeatedly.
+        Only the date window is merged in at request time.
+        """
 
-        today = datetime.today()
-        today_next_year = today + date_delta.relativedelta(years=1)
+        config = self.theater_config
 
-        body = {
+        return {
             "theaters": [
                 {
                     "id": config.theater_id,
@@ -216,21 +536,63 @@ class TheaterScraper:
                 }
             ],
             "movieIds": self.movie_ids,
-            "from": today.isoformat(),
-            "to": today_next_year.isoformat(),
             "websiteId": config.website_id,
         }
 
+    def _get_theater_schedule(self) -> Sequence[dict]:
+        """Get current schedule for theater.
+
+        Make a POST request to the schedule_endpoint using today's
+        date and the movie IDs found in the current endpoint containing
+        movie data. Results are cached on disk for schedule_cache_ttl
+        seconds, keyed by theater, date, and movie IDs, so repeated
+        runs within the window skip the POST entirely.
+
+        Returns:
+            schedule: A list of unparsed showings, as provided by the
+                Boxoffice CMS API
+        """
+
+        config = self.theater_config
+
+        cache_path = self._schedule_cache_path()
+
+        if (
+            cache_path.exists()
+            and time.time() - cache_path.stat().st_mtime < self.schedule_cache_ttl
+        ):
+            return orjson.loads(cache_path.read_bytes())
+
+        from_iso, to_iso = _schedule_window()
+
+        body = self._schedule_body_template | {"from": from_iso, "to": to_iso}
+
+        # Serialize once with orjson instead of letting requests run
+        # the body through stdlib json.dumps
+        payload = orjson.dumps(body)
+
         try:
-            response = requests.post(config.schedule_endpoint, json=body, timeout=30)
+            response = self._session.post(
+                config.schedule_endpoint,
+                data=payload,
+                headers={"Content-Type": "application/json"},
+                timeout=30,
+            )
             response.raise_for_status()
-            schedule = response.json().get(config.theater_id, {}).get("schedule")
+            schedule = (
+                orjson.loads(response.content).get(config.theater_id, {}).get("schedule")
+            )
 
             if schedule is None:
                 raise ValueError(
                     "Response from schedule endpoint was successful, but schedule data could not be found"
                 )
 
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = cache_path.with_suffix(".json.tmp")
+            temp_path.write_bytes(orjson.dumps(schedule))
+            os.replace(temp_path, cache_path)
+
             return schedule
 
         except req_exceptions.RequestException as e:
@@ -238,10 +600,107 @@ class TheaterScraper:
                 f"Failed to get schedule from {config.schedule_endpoint}: {e}"
             )
 
+    def _schedule_cache_path(self) -> Path:
+        """Get the on-disk cache location for the current schedule.
+
+        The key covers theater, date, and movie IDs so that a new day
+        or a change in the movie lineup naturally misses the cache.
+        """
+
+        config = self.theater_config
+
+        key_material = orjson.dumps(
+            {
+                "t": config.theater_id,
+                "d": datetime.today().date().isoformat(),
+                "m": sorted(self.movie_ids),
+            }
+        )
+        key = hashlib.blake2b(key_material, digest_size=16).hexdigest()
+
+        return (
+            Path.home()
+            / ".cache"
+            / "moviescraper"
+            / config.theater_id
+            / f"schedule-{key}.json"
+        )
+
+
+def schedule_batch(scrapers: Sequence[TheaterScraper]) -> dict[str, Sequence[dict]]:
+    """Fetch schedules for several theaters with a single POST.
+
+    The Boxoffice CMS schedule endpoint accepts a list of theaters per
+    request, so scraping multiple venues on the same website does not
+    need one POST each. All theaters are merged into one request body
+    and the reply is split back out per theater ID. For a single
+    scraper this matches _get_theater_schedule; for N venues it saves
+    N-1 round trips.
+
+    Args:
+        scrapers: Scrapers for the theaters to include, all using the
+            same schedule endpoint and website ID
+
+    Returns:
+        A mapping of theater ID to that theater's list of showings
+    """
+
+    if not scrapers:
+        return {}
+
+    config = scrapers[0].theater_config
+
+    from_iso, to_iso = _schedule_window()
+
+    body = {
+        "theaters": [
+            {
+                "id": scraper.theater_config.theater_id,
+                "timeZone": "America/Los_Angeles",
+            }
+            for scraper in scrapers
+        ],
+        "movieIds": sorted(set().union(*(s.movie_ids for s in scrapers))),
+        "from": from_iso,
+        "to": to_iso,
+        "websiteId": config.website_id,
+    }
+
+    payload = orjson.dumps(body)
+
+    try:
+        response = _SESSION.post(
+            config.schedule_endpoint,
+            data=payload,
+            headers={"Content-Type": "application/json"},
+            timeout=30,
+        )
+        response.raise_for_status()
+        reply = orjson.loads(response.content)
+
+    except req_exceptions.RequestException as e:
+        raise req_exceptions.RequestException(
+            f"Failed to get schedules from {config.schedule_endpoint}: {e}"
+        )
+
+    schedules = {}
+
+    for scraper in scrapers:
+        theater_id = scraper.theater_config.theater_id
+        schedule = reply.get(theater_id, {}).get("schedule")
+
+        if schedule is None:
+            raise ValueError(
+                "Response from schedule endpoint was successful, but schedule data "
+                f"could not be found for theater {theater_id}"
+            )
+
+        schedules[theater_id] = schedule
+
+    return schedules
+
 
 def main():
     onyx_config = TheaterConfig.from_env("env/onyx.env")
     onyx_scraper = TheaterScraper(onyx_config)
-
-    schedule = onyx_scraper.get_schedule()
-    print(schedule)
+    print(onyx_scraper.movie_schedule)